@@ -3,8 +3,15 @@ Main application file
 Uses the modular Flask framework from library/
 """
 
+import logging
+
+from flask import Response
+
 from library import create_app
 
+# Show the framework's startup analysis (module, theme and dashboard info)
+logging.basicConfig(level=logging.INFO, format='%(message)s')
+
 app = create_app(
         modules=['dashboard', 'auth'], 
         config={
@@ -14,19 +21,18 @@ app = create_app(
         site_name='Project Demo'
     )
 
-# Debug route to check theme and dashboard
-@app.route('/debug')
-def debug():
-    dashboard_type = app.config.get('DASHBOARD_TYPE', 'default')
-    modules_list = ', '.join(app.config.get('MODULES', []))
-    
-    return f"""
+# Debug page - everything it shows is fixed once the app is configured, so
+# render it a single time and serve the cached bytes on every request
+_dashboard_type = app.config.get('DASHBOARD_TYPE', 'default')
+_modules_list = ', '.join(app.config.get('MODULES', []))
+
+_DEBUG_HTML = f"""
     <h1>🔧 Flask App Debug Info</h1>
     <div style="background: #f8f9fa; padding: 20px; border-radius: 8px; font-family: monospace;">
         <h2>📊 Dashboard Configuration</h2>
-        <p><strong>Dashboard Type:</strong> <span style="color: #007bff; font-size: 1.2em;">{dashboard_type}</span></p>
-        <p><strong>Dashboard Template:</strong> templates/dashboard/{dashboard_type}-dashboard.html</p>
-        <p><strong>Active Modules:</strong> {modules_list}</p>
+        <p><strong>Dashboard Type:</strong> <span style="color: #007bff; font-size: 1.2em;">{_dashboard_type}</span></p>
+        <p><strong>Dashboard Template:</strong> templates/dashboard/{_dashboard_type}-dashboard.html</p>
+        <p><strong>Active Modules:</strong> {_modules_list}</p>
         
         <h2>🎨 Theme Configuration</h2>
         <p><strong>Theme:</strong> {app.config.get('THEME')}</p>
@@ -40,7 +46,11 @@ def debug():
         <p><a href="/" style="color: #007bff;">← Back to Dashboard</a></p>
         <p><a href="/static/{app.config.get('THEME')}.css?v={app.config.get('CACHE_BUSTER')}" target="_blank">View CSS File →</a></p>
     </div>
-    """
+""".encode('utf-8')
+
+@app.route('/debug')
+def debug():
+    return Response(_DEBUG_HTML, mimetype='text/html')
 
 if __name__ == '__main__':
     app.run(debug=True)
\ No newline at end of file
@@ -3,27 +3,61 @@ Modular Flask Library
 Contains reusable modules for rapid Flask development
 """
 
-from flask import Flask, url_for
-from .modules.auth import Auth, auth
-from .modules.database import DatabaseManager, db
+import functools
+import importlib
+import logging
+import os
+import sys
+
+from flask import Flask, g, url_for
+from werkzeug.routing import BuildError
 from .routes import ROUTE_MODULES
 
-# Module dependency definitions
+logger = logging.getLogger(__name__)
+
+# Project folder layout - constant for the life of the process, so resolve once
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_INSTANCE_PATH = os.path.join(_PROJECT_ROOT, 'instance')     # For database and user data
+_STATIC_PATH = os.path.join(_PROJECT_ROOT, 'static')         # For CSS, JS, images
+_TEMPLATE_PATH = os.path.join(_PROJECT_ROOT, 'templates')    # For HTML templates
+_DEFAULT_DATABASE_PATH = os.path.join(_INSTANCE_PATH, 'app.db')
+
+# Set once the instance folder has been created, so later create_app calls
+# skip the filesystem check
+_instance_ready = False
+
+# Public names served lazily by __getattr__ so that `import library` does not
+# pay for auth (bcrypt) or the database layer until they are actually used
+_LAZY_EXPORTS = {
+    'Auth': '.modules.auth',
+    'auth': '.modules.auth',
+    'DatabaseManager': '.modules.database',
+    'db': '.modules.database',
+}
+
+def __getattr__(name):
+    """Import lazily exported names on first access (PEP 562)"""
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Module dependency definitions (tuples: immutable and cheap to iterate)
 MODULE_DEPENDENCIES = {
-    'auth': ['database'],           # auth requires database
-    'dashboard': [],                # dashboard works standalone but enhanced by auth
-    'main': [],                     # main is standalone
-    'database': [],                 # database is a backend module (no routes)
-    'chat': ['database'],           # chat requires database for message/room persistence
-    'blog': ['auth', 'database'],   # blog requires auth and database
-    'contact': [],                  # contact works standalone
+    'auth': ('database',),          # auth requires database
+    'dashboard': (),                # dashboard works standalone but enhanced by auth
+    'main': (),                     # main is standalone
+    'database': (),                 # database is a backend module (no routes)
+    'chat': ('database',),          # chat requires database for message/room persistence
+    'blog': ('auth', 'database'),   # blog requires auth and database
+    'contact': (),                  # contact works standalone
    
 }
 
 # Backend modules that don't have routes
-BACKEND_MODULES = {'database'}
+BACKEND_MODULES = frozenset({'database'})
 
-def validate_dependencies(requested_modules):
+def validate_dependencies(requested_modules, verbose=True):
     """
     Intelligent Module Dependency Validator and Auto-Resolver
     =========================================================
@@ -38,64 +72,108 @@ def validate_dependencies(requested_modules):
     Args:
         requested_modules (list): List of module names the user wants to load
                                  e.g., ['blog', 'chat'] 
+        verbose (bool, optional): Build the human-readable warning messages.
+                                 Pass False when the warnings are not shown.
     
     Returns:
-        tuple: (validated_modules, warnings, errors)
-               - validated_modules (list): Complete list including auto-resolved deps
+        tuple: (validated_modules, warnings, errors, auto_added)
+               - validated_modules (list): Complete list including auto-resolved deps,
+                                           dependencies always before dependents
                - warnings (list): Human-readable messages about auto-added modules
                - errors (list): Error messages for invalid/unknown modules
+               - auto_added (list): Modules pulled in only as dependencies
     
     Example:
         >>> validate_dependencies(['blog'])
-        (['database', 'auth', 'blog'], ['Auto-added auth', 'Auto-added database'], [])
+        (['database', 'auth', 'blog'], ["Auto-added dependency 'auth' ...", "Auto-added dependency 'database' ..."], [], ['database', 'auth'])
         
         This shows that requesting 'blog' automatically included its dependencies.
+    
+    Note:
+        Results are memoized per set of requested modules, so test suites that
+        build many apps resolve each module combination only once. Call
+        ``_validate_dependencies_cached.cache_clear()`` after changing
+        MODULE_DEPENDENCIES at runtime.
     """
     if not requested_modules:
-        return [], [], []
+        return [], [], [], []
+    
+    # Resolution only depends on which modules were asked for, so repeated
+    # create_app calls with the same module set hit the cache. Names are
+    # interned to match the registry keys (string literals are interned by
+    # CPython), giving pointer-equality hits on every dict/set lookup.
+    modules_fs = frozenset(sys.intern(m) if isinstance(m, str) else m
+                           for m in requested_modules)
+    validated, warnings, errors, auto_added = _validate_dependencies_cached(modules_fs, verbose)
+    return list(validated), list(warnings), list(errors), list(auto_added)
+
+@functools.lru_cache(maxsize=128)
+def _validate_dependencies_cached(modules_fs, verbose=True):
+    """
+    Memoized worker for validate_dependencies.
+    
+    Walks the dependency graph with an iterative depth-first search on an
+    explicit stack and emits modules in post-order, so every dependency is
+    listed before the modules that need it. Each module is visited once:
+    O(modules + dependencies) with no Python call frame per node.
+    
+    Args:
+        modules_fs (frozenset): Requested module names (hashable cache key)
+        verbose (bool): Whether to build warning messages
     
-    # Use set for O(1) lookup and automatic deduplication
-    validated = set()
+    Returns:
+        tuple: (validated, warnings, errors, auto_added) as tuples so cached
+               results cannot be mutated by callers
+    """
+    validated = []      # Post-order result (dependencies first)
+    seen = set()        # O(1) "already visited" check
     warnings = []
     errors = []
+    auto_added = []     # Modules reached only as someone's dependency
     
-    def add_module_with_deps(module_name, auto_added=False):
-        """
-        Recursively add a module and all its dependencies.
-        
-        Args:
-            module_name (str): Name of module to add
-            auto_added (bool): Whether this module was auto-added vs explicitly requested
-        """
-        # Skip if already processed (prevents infinite recursion)
-        if module_name in validated:
-            return
+    # Sorted roots keep the load order stable regardless of set hashing
+    # (key=str so a non-string name is reported as unknown, not a TypeError)
+    for root in sorted(modules_fs, key=str):
+        # Stack entries: (module, module that required it, deps already pushed?)
+        stack = [(root, None, False)]
+        while stack:
+            module_name, required_by, expanded = stack.pop()
             
-        # Validate module exists in our registry
-        if module_name not in MODULE_DEPENDENCIES:
-            errors.append(f"❌ Unknown module: '{module_name}'")
-            return
+            # Second visit: all dependencies are in place, emit the module
+            if expanded:
+                validated.append(module_name)
+                if module_name not in modules_fs:
+                    auto_added.append(module_name)
+                continue
             
-        # First, recursively add all dependencies
-        # This ensures dependencies are loaded before dependents
-        deps = MODULE_DEPENDENCIES[module_name]
-        for dep in deps:
-            if dep not in validated:
-                add_module_with_deps(dep, auto_added=True)
-                # Only warn about auto-added deps, not explicitly requested ones
-                if auto_added:
-                    warnings.append(f"⚠️  Auto-added dependency '{dep}' required by '{module_name}'")
-        
-        # Finally, add the module itself to our validated set
-        validated.add(module_name)
-    
-    # Process all explicitly requested modules
-    # Each will recursively pull in its dependencies
-    for module in requested_modules:
-        add_module_with_deps(module, auto_added=False)
+            # Skip if already processed (also guards against cycles)
+            if module_name in seen:
+                continue
+            seen.add(module_name)
+            
+            # Validate module exists in our registry
+            deps = MODULE_DEPENDENCIES.get(module_name)
+            if deps is None:
+                errors.append(f"❌ Unknown module: '{module_name}'")
+                continue
+            
+            # Only warn about auto-added deps, not explicitly requested ones
+            if verbose and required_by is not None and module_name not in modules_fs:
+                warnings.append(f"⚠️  Auto-added dependency '{module_name}' required by '{required_by}'")
+            
+            # Revisit this module after its dependencies have been emitted
+            stack.append((module_name, required_by, True))
+            for dep in reversed(deps):
+                if dep not in seen:
+                    stack.append((dep, module_name, False))
     
-    # Return as list (ordered), plus human-readable feedback
-    return list(validated), warnings, errors
+    # Return as tuples (immutable cache entry), plus human-readable feedback
+    return tuple(validated), tuple(warnings), tuple(errors), tuple(auto_added)
+
+@functools.lru_cache(maxsize=32)
+def _theme_css_url(static_url_path, theme, cache_buster):
+    """Theme stylesheet URL, memoized on everything it depends on"""
+    return f"{static_url_path}/{theme}.css?v={cache_buster}"
 
 def create_app(modules=None, config=None, site_name=None):
     """
@@ -126,6 +204,10 @@ def create_app(modules=None, config=None, site_name=None):
                                 - 'DASHBOARD_TYPE': 'default', 'blog', 'chat'
                                 - 'DATABASE_PATH': custom database file location
                                 - 'SECRET_KEY': for production security
+                                - 'BCRYPT_ROUNDS': password hashing cost (default 12,
+                                                   or the BCRYPT_ROUNDS env var)
+                                - 'PASSWORD_CACHE_TTL': seconds a successful password
+                                                        check is reused (0 disables)
                                 
         site_name (str, optional): Display name for the application.
                                   Used in templates and page titles.
@@ -137,47 +219,47 @@ def create_app(modules=None, config=None, site_name=None):
         ValueError: If module dependencies cannot be resolved or unknown modules specified
         
     Note:
-        The function provides detailed console output showing dependency resolution,
-        theme selection, and module loading status. This helps with debugging and
-        understanding what functionality is available.
+        The function logs detailed output (INFO level, logger 'library') showing
+        dependency resolution, theme selection, and module loading status. This
+        helps with debugging and understanding what functionality is available.
     """
-    from flask import Flask
-    import os
-    
     # ========================================================================
     # STEP 1: INTELLIGENT MODULE DEPENDENCY RESOLUTION
     # ========================================================================
     # Analyze requested modules and automatically include any missing dependencies
     # This prevents runtime errors and ensures all required functionality is available
     if modules:
-        validated_modules, warnings, errors = validate_dependencies(modules)
+        verbose = logger.isEnabledFor(logging.INFO)
+        validated_modules, warnings, errors, auto_added = validate_dependencies(modules, verbose=verbose)
         
         # Provide detailed console feedback for developer awareness
-        # This helps users understand what's being loaded and why
-        print("🔧 MODULE DEPENDENCY ANALYSIS")
-        print("=" * 40)
-        print(f"📋 Requested: {modules}")
-        print(f"✅ Loading: {validated_modules}")
-        
-        # Show any auto-resolved dependencies with explanatory warnings
-        if warnings:
-            print("\n⚠️  DEPENDENCY WARNINGS:")
-            for warning in warnings:
-                print(f"   {warning}")
+        # This helps users understand what's being loaded and why.
+        # Skipped entirely (no formatting) when INFO logging is off.
+        if verbose:
+            logger.info("🔧 MODULE DEPENDENCY ANALYSIS")
+            logger.info("=" * 40)
+            logger.info("📋 Requested: %s", modules)
+            logger.info("✅ Loading: %s", validated_modules)
+            
+            # Show any auto-resolved dependencies with explanatory warnings
+            if warnings:
+                logger.info("⚠️  DEPENDENCY WARNINGS:")
+                for warning in warnings:
+                    logger.info("   %s", warning)
         
         # Halt execution if invalid modules specified - fail fast principle
         if errors:
-            print("\n❌ DEPENDENCY ERRORS:")
+            logger.error("❌ DEPENDENCY ERRORS:")
             for error in errors:
-                print(f"   {error}")
+                logger.error("   %s", error)
             raise ValueError("Module dependency validation failed. Check errors above.")
         
-        # Highlight any modules that were auto-added for transparency
-        if set(validated_modules) != set(modules):
-            auto_added = set(validated_modules) - set(modules)
-            print(f"\n🔄 Auto-resolved dependencies: {auto_added}")
-        
-        print("=" * 40)
+        if verbose:
+            # Highlight any modules that were auto-added for transparency
+            if auto_added:
+                logger.info("🔄 Auto-resolved dependencies: %s", auto_added)
+            
+            logger.info("=" * 40)
         modules = validated_modules
     else:
         # Handle case where no modules specified - create minimal Flask app
@@ -186,20 +268,18 @@ def create_app(modules=None, config=None, site_name=None):
     # ========================================================================
     # STEP 2: FLASK APPLICATION SETUP WITH PROPER FOLDER STRUCTURE  
     # ========================================================================
-    # Configure Flask with proper paths for templates, static files, and data storage
-    project_root = os.path.dirname(os.path.dirname(__file__))
-    instance_path = os.path.join(project_root, 'instance')     # For database and user data
-    static_path = os.path.join(project_root, 'static')         # For CSS, JS, images
-    template_path = os.path.join(project_root, 'templates')    # For HTML templates
-    
     # Ensure data directory exists - Flask won't create it automatically
-    os.makedirs(instance_path, exist_ok=True)
+    global _instance_ready
+    if not _instance_ready:
+        os.makedirs(_INSTANCE_PATH, exist_ok=True)
+        _instance_ready = True
     
     # Initialize Flask with explicit paths for predictable behavior across environments
+    # (template/static/instance paths are resolved once at import, see _PROJECT_ROOT)
     app = Flask(__name__, 
-                template_folder=template_path,      # HTML templates location
-                static_folder=static_path,          # CSS/JS/images location  
-                instance_path=instance_path,        # Private data storage
+                template_folder=_TEMPLATE_PATH,     # HTML templates location
+                static_folder=_STATIC_PATH,         # CSS/JS/images location  
+                instance_path=_INSTANCE_PATH,       # Private data storage
                 instance_relative_config=True)     # Enable config files in instance/
     
     # ========================================================================
@@ -209,12 +289,13 @@ def create_app(modules=None, config=None, site_name=None):
     app.config.update({
         # Security configuration
         'SECRET_KEY': 'change-this-in-production',     # MUST be changed for production
+        'PASSWORD_CACHE_TTL': 30,                      # Reuse successful bcrypt checks (0 = off)
         
         # Development settings  
         'DEBUG': True,                                 # Disable in production
         
         # Database configuration
-        'DATABASE_PATH': os.path.join(instance_path, 'app.db'),  # SQLite in instance folder
+        'DATABASE_PATH': _DEFAULT_DATABASE_PATH,  # SQLite in instance folder
         
         # Theme and UI configuration
         'THEME': 'light-professional',                 # Default professional appearance
@@ -228,66 +309,123 @@ def create_app(modules=None, config=None, site_name=None):
     
     # Override defaults with user-provided configuration
     if config:
-        app.config.update(config)    # Show theme, site, and dashboard information
-    theme = app.config.get('THEME', 'light-professional')
-    site_name_display = app.config.get('SITE_NAME') or 'Unnamed Project'
-    dashboard_type = app.config.get('DASHBOARD_TYPE', 'default')
+        app.config.update(config)
     
-    print(f"🎨 THEME: {theme}")
-    print(f"🏷️  SITE: {site_name_display}")
-    print(f"📊 DASHBOARD: {dashboard_type}")
-    print("=" * 40)
+    # Show theme, site, and dashboard information
+    logger.info("🎨 THEME: %s", app.config.get('THEME', 'light-professional'))
+    logger.info("🏷️  SITE: %s", app.config.get('SITE_NAME') or 'Unnamed Project')
+    logger.info("📊 DASHBOARD: %s", app.config.get('DASHBOARD_TYPE', 'default'))
+    logger.info("=" * 40)
     
     # Initialize selected modules
     # Database must be loaded first if needed
     if 'database' in modules:
+        from .modules.database import DatabaseManager
+
         # Initialize database with Flask app's configured path
         app.db = DatabaseManager(app.config.get('DATABASE_PATH'))
-        print("✅ Database module loaded")
+        logger.info("✅ Database module loaded")
+
+    if 'auth' in modules:
+        from .modules.auth import auth, DEFAULT_BCRYPT_ROUNDS
+        from .modules.database import db
 
     # Always provide module info and safe URL building so templates can
     # safely reference module routes even if those modules are not enabled.
-    @app.context_processor
-    def inject_helpers():
-        def safe_url_for(endpoint, **values):
-            """Safely build URL, return '#' if route doesn't exist"""
+    def safe_url_for(endpoint, **values):
+        """Safely build URL, return '#' if route doesn't exist"""
+        # Membership test on the endpoint registry avoids raising and
+        # catching a BuildError for every link to a module that isn't loaded
+        if endpoint not in app.view_functions:
+            return '#'
+        
+        # Nav links repeat the same endpoints many times per page, so keep
+        # built URLs for the rest of the request (flask.g is per request)
+        cache = g.setdefault('_safe_url_cache', {})
+        try:
+            key = (endpoint, tuple(sorted(values.items())))
+            url = cache.get(key)
+        except TypeError:
+            # Unhashable values (e.g. a list of query args): build uncached
+            key = url = None
+        if url is None:
             try:
-                return url_for(endpoint, **values)
-            except:
-                return '#'
+                url = url_for(endpoint, **values)
+            except BuildError:
+                url = '#'
+            if key is not None:
+                cache[key] = url
+        return url
 
-        result = {
-            'available_modules': modules,
-            'safe_url_for': safe_url_for,
-            'current_user': None
-        }
+    # Everything except current_user is fixed for the lifetime of the app,
+    # so build it once and only overlay the user per render
+    static_context = {
+        'available_modules': modules,
+        'safe_url_for': safe_url_for,
+    }
+    auth_loaded = 'auth' in modules
+
+    @app.context_processor
+    def inject_helpers():
+        result = static_context.copy()
 
         # Add current_user if auth module is loaded
-        if 'auth' in modules:
+        user = None
+        if auth_loaded:
             try:
                 user = auth.get_current_user()
-                # If no user or user is None, provide Guest fallback
-                result['current_user'] = user if user else {'username': 'Guest'}
             except Exception:
-                result['current_user'] = {'username': 'Guest'}
-        else:
-            result['current_user'] = {'username': 'Guest'}
+                user = None
+        # If no user or user is None, provide Guest fallback
+        result['current_user'] = user if user else {'username': 'Guest'}
+
+        # Looked up per render so a later change to config.THEME takes effect;
+        # the URL itself is only built once per theme
+        result['theme_css_url'] = _theme_css_url(
+            app.static_url_path,
+            app.config.get('THEME') or 'light-professional',
+            app.config.get('CACHE_BUSTER', '1.0'),
+        )
 
         return result
 
     if 'auth' in modules:
+        # Hashing cost vs login latency. Resolved only here, so a bad value
+        # can't break apps that never hash a password.
+        rounds = app.config.get('BCRYPT_ROUNDS')
+        if rounds is None:
+            rounds = os.environ.get('BCRYPT_ROUNDS', DEFAULT_BCRYPT_ROUNDS)
+        try:
+            rounds = int(rounds)
+        except (TypeError, ValueError):
+            rounds = None
+        if rounds is None or not 4 <= rounds <= 31:
+            raise ValueError("BCRYPT_ROUNDS must be an integer between 4 and 31")
+        app.config['BCRYPT_ROUNDS'] = rounds
+        
         auth.db = db
-        print("✅ Auth module loaded")
+        auth.bcrypt_rounds = rounds
+        auth.password_cache_ttl = app.config['PASSWORD_CACHE_TTL']
+        logger.info("✅ Auth module loaded")
 
-    # Register routes for each module (skip backend modules)
-    for module_name in modules:
-        if module_name in BACKEND_MODULES:
-            print(f"✅ {module_name.title()} backend module loaded")
-        elif module_name in ROUTE_MODULES:
-            ROUTE_MODULES[module_name](app)
-            print(f"✅ {module_name.title()} routes registered")
-        else:
-            print(f"⚠️  Warning: {module_name} module not found in route registry")
+    # Partition once: backend modules have no routes, the rest must be in the
+    # route registry (dependency order from validate_dependencies is kept)
+    backend_modules = [m for m in modules if m in BACKEND_MODULES]
+    # Registrar callables are resolved here so the loop below is a plain call list
+    route_registrars = [(m, ROUTE_MODULES[m]) for m in modules
+                        if m not in BACKEND_MODULES and m in ROUTE_MODULES]
+    unregistered = [m for m in modules if m not in BACKEND_MODULES and m not in ROUTE_MODULES]
+    
+    # Register routes for each route-bearing module
+    for _, register_routes in route_registrars:
+        register_routes(app)
+    
+    if backend_modules:
+        logger.info("✅ Backend modules loaded: %s", ', '.join(backend_modules))
+    if route_registrars:
+        logger.info("✅ Routes registered: %s", ', '.join(m for m, _ in route_registrars))
+    if unregistered:
+        logger.warning("⚠️  Warning: not found in route registry: %s", ', '.join(unregistered))
     
     return app
 
@@ -3,44 +3,132 @@ Authentication module for Project L
 Handles user registration, login, logout, and session management
 """
 
-from flask import session, request, redirect, url_for, flash
-import bcrypt
+from flask import session, request, redirect, url_for, flash, g
+from collections import OrderedDict
 from functools import wraps
+import hashlib
+import os
 import re
+import string
+import threading
+import time
+
+# Compiled once at import instead of going through re's pattern cache per call
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# Character classes for the password strength check ([A-Z] / [a-z])
+_ASCII_UPPER = frozenset(string.ascii_uppercase)
+_ASCII_LOWER = frozenset(string.ascii_lowercase)
+
+# bcrypt's own default cost; each +1 doubles hashing time
+DEFAULT_BCRYPT_ROUNDS = 12
+
+# Successful password checks are remembered this long (seconds, 0 disables)
+DEFAULT_PASSWORD_CACHE_TTL = 30
+PASSWORD_CACHE_MAXSIZE = 1024
+
+_BCRYPT_PREFIXES = ('$2a$', '$2b$', '$2y$')
+_BCRYPT_PREFIXES_BYTES = tuple(p.encode('ascii') for p in _BCRYPT_PREFIXES)
+_BCRYPT_HASH_LENGTH = 60
+
+def _is_bcrypt_hash(value):
+    """Cheap structural check that value looks like a bcrypt hash (bytes or str)"""
+    if isinstance(value, bytes):
+        prefixes = _BCRYPT_PREFIXES_BYTES
+    elif isinstance(value, str):
+        prefixes = _BCRYPT_PREFIXES
+    else:
+        return False
+    return len(value) == _BCRYPT_HASH_LENGTH and value.startswith(prefixes)
 
 class Auth:
-    def __init__(self, db_manager=None):
+    def __init__(self, db_manager=None, bcrypt_rounds=DEFAULT_BCRYPT_ROUNDS,
+                 password_cache_ttl=DEFAULT_PASSWORD_CACHE_TTL):
         self.db = db_manager
+        self.bcrypt_rounds = bcrypt_rounds
+        self.password_cache_ttl = password_cache_ttl
+        
+        # (password_hash, fingerprint) -> expiry time, oldest first. The
+        # fingerprint is a BLAKE2b MAC under a random per-process key, so the
+        # cache never holds the plaintext or anything crackable offline.
+        self._pw_cache = OrderedDict()
+        self._pw_cache_lock = threading.Lock()
+        self._pw_cache_key = os.urandom(32)
     
     def validate_email(self, email):
         """Validate email format"""
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(pattern, email) is not None
+        return _EMAIL_RE.match(email) is not None
     
     def validate_password(self, password):
         """Validate password strength"""
         if len(password) < 8:
             return False, "Password must be at least 8 characters long"
-        if not re.search(r'[A-Z]', password):
+        
+        # One pass over the password instead of one regex scan per class
+        has_upper = has_lower = has_digit = False
+        for c in password:
+            if c in _ASCII_UPPER:
+                has_upper = True
+            elif c in _ASCII_LOWER:
+                has_lower = True
+            elif c.isdecimal():
+                has_digit = True
+            if has_upper and has_lower and has_digit:
+                break
+        
+        if not has_upper:
             return False, "Password must contain at least one uppercase letter"
-        if not re.search(r'[a-z]', password):
+        if not has_lower:
             return False, "Password must contain at least one lowercase letter"
-        if not re.search(r'\d', password):
+        if not has_digit:
             return False, "Password must contain at least one number"
         return True, "Password is valid"
     
     def hash_password(self, password):
-        """Hash password using bcrypt"""
+        """Hash password using bcrypt (returns bytes, stored as a BLOB)"""
+        import bcrypt  # Deferred: only paid on first use (cached in sys.modules)
+        
         # Convert password to bytes and generate salt
         password_bytes = password.encode('utf-8')
-        salt = bcrypt.gensalt()
-        return bcrypt.hashpw(password_bytes, salt).decode('utf-8')
+        salt = bcrypt.gensalt(rounds=self.bcrypt_rounds)
+        return bcrypt.hashpw(password_bytes, salt)
     
     def check_password(self, password_hash, password):
-        """Verify password against bcrypt hash"""
+        """Verify password against bcrypt hash (bytes, or str from older rows)"""
+        # A missing or malformed hash can never match - don't run bcrypt on it
+        if not _is_bcrypt_hash(password_hash):
+            return False
+        
         password_bytes = password.encode('utf-8')
-        hash_bytes = password_hash.encode('utf-8')
-        return bcrypt.checkpw(password_bytes, hash_bytes)
+        
+        # Repeat logins within the TTL skip bcrypt. Only successes are cached,
+        # so guessing different passwords still pays the full bcrypt cost.
+        ttl = self.password_cache_ttl
+        if ttl:
+            fingerprint = hashlib.blake2b(password_bytes, key=self._pw_cache_key,
+                                          digest_size=16).digest()
+            cache_key = (password_hash, fingerprint)
+            now = time.monotonic()
+            with self._pw_cache_lock:
+                expires = self._pw_cache.get(cache_key)
+                if expires is not None:
+                    if expires > now:
+                        return True
+                    del self._pw_cache[cache_key]
+        
+        import bcrypt  # Deferred: only paid on first use (cached in sys.modules)
+        
+        # New hashes come back from the database as bytes - no re-encode needed
+        hash_bytes = password_hash if isinstance(password_hash, bytes) else password_hash.encode('utf-8')
+        matched = bcrypt.checkpw(password_bytes, hash_bytes)
+        
+        if matched and ttl:
+            with self._pw_cache_lock:
+                self._pw_cache[cache_key] = now + ttl
+                self._pw_cache.move_to_end(cache_key)
+                while len(self._pw_cache) > PASSWORD_CACHE_MAXSIZE:
+                    self._pw_cache.popitem(last=False)
+        return matched
     
     def register_user(self, username, email, password):
         """Register a new user"""
@@ -91,6 +179,7 @@ class Auth:
                 session['username'] = user['username']
                 session['email'] = user['email']
                 session['logged_in'] = True
+                g.pop('_auth_logged_in', None)
                 return True, "Login successful"
             else:
                 return False, "Invalid email or password"
@@ -101,11 +190,17 @@ class Auth:
     def logout_user(self):
         """Clear user session"""
         session.clear()
+        g.pop('_auth_logged_in', None)
         return True, "Logged out successfully"
     
     def is_logged_in(self):
         """Check if user is logged in"""
-        return session.get('logged_in', False)
+        # Cached on g for the rest of the request: require_login followed by
+        # get_current_user (and the template context) reads the session once.
+        # login_user/logout_user drop the cached value.
+        if '_auth_logged_in' not in g:
+            g._auth_logged_in = session.get('logged_in', False)
+        return g._auth_logged_in
     
     def get_current_user(self):
         """Get current user info from session"""
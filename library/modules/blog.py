@@ -3,155 +3,245 @@ Blog module for content management
 Provides blog posts, categories, comments, and publishing functionality
 """
 
-from flask import render_template, request, redirect, url_for, flash, abort
+from flask import render_template, request, redirect, url_for, flash, abort, make_response
+from collections import Counter
 from datetime import datetime
+from types import MappingProxyType
+import hashlib
+import re
+import threading
+import time
+
+# Comma separator for the write form's tag field, swallowing surrounding spaces
+_TAG_SPLIT = re.compile(r'\s*,\s*')
+
+# Seconds a DB-backed listing is reused before re-querying (BLOG_CACHE_TIMEOUT)
+DEFAULT_BLOG_CACHE_TIMEOUT = 60
+BLOG_CACHE_MAXSIZE = 256
+
+# Sample content shown when the database module is not loaded. Built once at
+# import; handlers hand these same objects to the templates on every request,
+# so the records are read-only mapping proxies.
+_SAMPLE_POSTS = (
+    MappingProxyType({
+        'id': 1,
+        'title': 'Getting Started with Python',
+        'excerpt': 'A comprehensive guide for beginners to learn Python programming from scratch.',
+        'author': 'John Doe',
+        'date': '2025-11-05',
+        'category': 'Programming',
+        'tags': ('python', 'beginner', 'tutorial'),
+        'views': 234,
+        'comments': 12,
+        'featured_image': '/static/blog1.jpg',
+        'published': True
+    }),
+    MappingProxyType({
+        'id': 2,
+        'title': 'Web Development Best Practices',
+        'excerpt': 'Essential tips and tricks for modern web development that every developer should know.',
+        'author': 'Jane Smith',
+        'date': '2025-11-04',
+        'category': 'Web Development',
+        'tags': ('web', 'best-practices', 'tips'),
+        'views': 189,
+        'comments': 8,
+        'featured_image': '/static/blog2.jpg',
+        'published': True
+    }),
+    MappingProxyType({
+        'id': 3,
+        'title': 'Database Design Fundamentals',
+        'excerpt': 'Understanding the principles of good database architecture and design patterns.',
+        'author': 'Mike Johnson',
+        'date': '2025-11-03',
+        'category': 'Database',
+        'tags': ('database', 'design', 'sql'),
+        'views': 156,
+        'comments': 5,
+        'featured_image': '/static/blog3.jpg',
+        'published': True
+    })
+)
+
+_SAMPLE_CATEGORIES = (
+    MappingProxyType({'name': 'Programming', 'count': 8}),
+    MappingProxyType({'name': 'Web Development', 'count': 6}),
+    MappingProxyType({'name': 'Database', 'count': 4}),
+    MappingProxyType({'name': 'Tutorials', 'count': 12}),
+    MappingProxyType({'name': 'Reviews', 'count': 3})
+)
+
+# Fallback post (its id is taken from the requested URL)
+_SAMPLE_POST = MappingProxyType({
+    'title': 'Getting Started with Python',
+    'content': '''
+    <p>Python is an excellent programming language for beginners and experienced developers alike. In this comprehensive guide, we'll explore the fundamentals of Python programming.</p>
+    ''',
+    'author': 'John Doe',
+    'date': '2025-11-05',
+    'category': 'Programming',
+    'tags': ('python', 'beginner', 'tutorial'),
+    'views': 234,
+    'featured_image': '/static/blog1.jpg'
+})
+
+_SAMPLE_COMMENTS = (
+    MappingProxyType({
+        'id': 1,
+        'author': 'Alice',
+        'content': 'Great tutorial! This really helped me understand Python basics.',
+        'date': '2025-11-05 14:30',
+        'avatar': '/static/avatar1.jpg'
+    }),
+)
+
+_SAMPLE_CATEGORY_POSTS = (
+    MappingProxyType({
+        'id': 1,
+        'title': 'Getting Started with Python',
+        'excerpt': 'A comprehensive guide for beginners.',
+        'author': 'John Doe',
+        'date': '2025-11-05',
+        'views': 234,
+        'comments': 12
+    }),
+)
+
+# Templates compiled at registration so the first visitor doesn't pay for it
+_BLOG_TEMPLATES = (
+    'base.html',
+    'blog/blog.html',
+    'blog/post.html',
+    'blog/category.html',
+    'blog/write.html',
+    'blog/search.html',
+)
+
+def _conditional_page(html):
+    """
+    Wrap a rendered page in a response that supports conditional GETs.
+    
+    The ETag is a hash of the exact bytes sent, so a browser revalidating an
+    unchanged page gets a 304 with no body. Pages carry the current user
+    (navbar) and flash messages, so they are marked private and must be
+    revalidated rather than shared by caches or reused blindly.
+    """
+    response = make_response(html)
+    response.set_etag(hashlib.blake2b(response.get_data(), digest_size=16).hexdigest())
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
 
 def register_blog_routes(app):
     """Register blog-related routes"""
     
+    # create_app attaches the database before registering routes, so resolve
+    # it once here instead of a hasattr() check on every request
+    db = getattr(app, 'db', None)
+    
+    # Listing data loaded from the database, keyed per view. Only the data is
+    # cached - pages are still rendered per request since the layout shows
+    # the current user. Cleared whenever a post is written. Shared by every
+    # request thread, so reads and writes go through listing_lock.
+    listing_cache = {}
+    listing_lock = threading.Lock()
+    
+    def cached_listing(key, loader):
+        """
+        Return loader() from the listing cache, reloading once it expires.
+        
+        Exceptions from loader() propagate and are not cached. Category keys
+        come from the URL, so the cache is capped at BLOG_CACHE_MAXSIZE:
+        expired entries are dropped first, then everything if still full.
+        """
+        timeout = app.config.get('BLOG_CACHE_TIMEOUT', DEFAULT_BLOG_CACHE_TIMEOUT)
+        now = time.monotonic()
+        with listing_lock:
+            hit = listing_cache.get(key)
+        if hit is not None and now - hit[0] < timeout:
+            return hit[1]
+        value = loader()    # outside the lock - other listings stay served
+        with listing_lock:
+            if key not in listing_cache and len(listing_cache) >= BLOG_CACHE_MAXSIZE:
+                for stale in [k for k, (stamp, _) in listing_cache.items() if now - stamp >= timeout]:
+                    del listing_cache[stale]
+                if len(listing_cache) >= BLOG_CACHE_MAXSIZE:
+                    listing_cache.clear()
+            listing_cache[key] = (now, value)
+        return value
+    
     @app.route('/blog')
     def blog_home():
         """Main blog listing page"""
         # If database module is available, load posts from DB; otherwise use sample posts
-        if hasattr(app, 'db') and app.db:
+        if db:
             try:
-                posts = app.db.get_posts(limit=20)
+                posts = cached_listing('home', lambda: db.get_posts_summary(limit=20))
             except Exception:
-                posts = []
+                posts = []    # Show an empty listing, but retry on the next request
         else:
-            # Sample blog posts
-            posts = [
-            {
-                'id': 1,
-                'title': 'Getting Started with Python',
-                'excerpt': 'A comprehensive guide for beginners to learn Python programming from scratch.',
-                'author': 'John Doe',
-                'date': '2025-11-05',
-                'category': 'Programming',
-                'tags': ['python', 'beginner', 'tutorial'],
-                'views': 234,
-                'comments': 12,
-                'featured_image': '/static/blog1.jpg',
-                'published': True
-            },
-            {
-                'id': 2,
-                'title': 'Web Development Best Practices',
-                'excerpt': 'Essential tips and tricks for modern web development that every developer should know.',
-                'author': 'Jane Smith',
-                'date': '2025-11-04',
-                'category': 'Web Development',
-                'tags': ['web', 'best-practices', 'tips'],
-                'views': 189,
-                'comments': 8,
-                'featured_image': '/static/blog2.jpg',
-                'published': True
-            },
-            {
-                'id': 3,
-                'title': 'Database Design Fundamentals',
-                'excerpt': 'Understanding the principles of good database architecture and design patterns.',
-                'author': 'Mike Johnson',
-                'date': '2025-11-03',
-                'category': 'Database',
-                'tags': ['database', 'design', 'sql'],
-                'views': 156,
-                'comments': 5,
-                'featured_image': '/static/blog3.jpg',
-                'published': True
-            }
-        ]
+            posts = _SAMPLE_POSTS
         
         # Sample categories
-        if hasattr(app, 'db') and app.db:
+        if db:
             # derive categories from posts if possible
-            cats = {}
-            for p in posts:
-                c = p.get('category') or 'Uncategorized'
-                cats[c] = cats.get(c, 0) + 1
-            categories = [{'name': k, 'count': v} for k, v in sorted(cats.items(), key=lambda x: -x[1])]
+            cats = Counter((p.category or 'Uncategorized') for p in posts)
+            categories = [{'name': k, 'count': v} for k, v in cats.most_common()]
         else:
-            categories = [
-                {'name': 'Programming', 'count': 8},
-                {'name': 'Web Development', 'count': 6},
-                {'name': 'Database', 'count': 4},
-                {'name': 'Tutorials', 'count': 12},
-                {'name': 'Reviews', 'count': 3}
-            ]
+            categories = _SAMPLE_CATEGORIES
         
-        return render_template('blog/blog.html', posts=posts, categories=categories)
+        return _conditional_page(render_template('blog/blog.html', posts=posts, categories=categories))
     
     @app.route('/blog/post/<int:post_id>')
     def blog_post(post_id):
         """Individual blog post view"""
         # Try to fetch post from DB if available
-        if hasattr(app, 'db') and app.db:
-            post = app.db.get_post_by_id(post_id)
+        if db:
+            post = db.get_post_by_id(post_id)
             comments = []
             related_posts = []
             if not post:
                 abort(404)
         else:
             # Fallback sample post
-            post = {
-                'id': post_id,
-                'title': 'Getting Started with Python',
-                'content': '''
-                <p>Python is an excellent programming language for beginners and experienced developers alike. In this comprehensive guide, we'll explore the fundamentals of Python programming.</p>
-                ''',
-                'author': 'John Doe',
-                'date': '2025-11-05',
-                'category': 'Programming',
-                'tags': ['python', 'beginner', 'tutorial'],
-                'views': 234,
-                'featured_image': '/static/blog1.jpg'
-            }
-            comments = [
-                {
-                    'id': 1,
-                    'author': 'Alice',
-                    'content': 'Great tutorial! This really helped me understand Python basics.',
-                    'date': '2025-11-05 14:30',
-                    'avatar': '/static/avatar1.jpg'
-                }
-            ]
+            post = dict(_SAMPLE_POST, id=post_id)
+            comments = _SAMPLE_COMMENTS
             related_posts = []
 
-        return render_template('blog/post.html', post=post, comments=comments, related_posts=related_posts)
+        return _conditional_page(render_template('blog/post.html', post=post, comments=comments, related_posts=related_posts))
     
     @app.route('/blog/category/<category_name>')
     def blog_category(category_name):
         """Posts by category"""
-        if hasattr(app, 'db') and app.db:
-            # simple filter using search helper
-            posts = [p for p in app.db.get_posts(limit=100) if (p.get('category') or '').lower() == category_name.lower()]
+        if db:
+            # filtered in SQL (case-insensitive, indexed) rather than in Python
+            posts = cached_listing(
+                ('category', category_name.lower()),
+                lambda: db.get_posts_by_category(category_name, limit=100)
+            )
         else:
-            posts = [
-                {
-                    'id': 1,
-                    'title': 'Getting Started with Python',
-                    'excerpt': 'A comprehensive guide for beginners.',
-                    'author': 'John Doe',
-                    'date': '2025-11-05',
-                    'views': 234,
-                    'comments': 12
-                }
-            ]
+            posts = _SAMPLE_CATEGORY_POSTS
 
-        return render_template('blog/category.html', posts=posts, category=category_name)
+        return _conditional_page(render_template('blog/category.html', posts=posts, category=category_name))
     
     @app.route('/blog/write', methods=['GET', 'POST'])
     def blog_write():
         """Create new blog post (requires auth)"""
         if request.method == 'POST':
-            title = request.form.get('title')
-            content = request.form.get('content')
-            category = request.form.get('category')
-            tags = request.form.get('tags')
+            # One MultiDict -> dict conversion instead of a lookup per field
+            form = request.form.to_dict(flat=True)
+            title = form.get('title')
+            content = form.get('content')
+            category = form.get('category')
+            tags = form.get('tags')
             # Try to save to database if available
-            if hasattr(app, 'db') and app.db:
-                post_id = app.db.create_post(title=title, content=content, author=(request.form.get('author') or 'Guest'), category=category, tags=[t.strip() for t in (tags or '').split(',') if t.strip()])
+            if db:
+                tag_list = [t for t in _TAG_SPLIT.split((tags or '').strip()) if t]
+                post_id = db.create_post(title=title, content=content, author=(form.get('author') or 'Guest'), category=category, tags=tag_list)
                 if post_id:
+                    with listing_lock:
+                        listing_cache.clear()
                     flash('Post created successfully!', 'success')
                     return redirect(url_for('blog_post', post_id=post_id))
                 else:
@@ -166,8 +256,12 @@ def register_blog_routes(app):
     def blog_search():
         """Search blog posts"""
         query = request.args.get('q', '')
-        if hasattr(app, 'db') and app.db and query:
-            posts = app.db.search_posts(query)
+        if db and query:
+            posts = db.search_posts(query)
         else:
             posts = []
-        return render_template('blog/search.html', posts=posts, query=query)
\ No newline at end of file
+        return render_template('blog/search.html', posts=posts, query=query)
+    
+    # Warm the Jinja template cache (the app keeps one environment for its lifetime)
+    for template_name in _BLOG_TEMPLATES:
+        app.jinja_env.get_template(template_name)
\ No newline at end of file
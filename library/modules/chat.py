@@ -3,119 +3,167 @@ Chat module for real-time messaging
 Provides chat rooms, direct messages, and messaging functionality
 """
 
-from flask import render_template, request, redirect, url_for, flash, jsonify
+from flask import render_template, request, redirect, url_for, flash, jsonify, abort, Response
 from datetime import datetime
+from types import MappingProxyType
+import json
+
+try:
+    # Optional: much faster JSON encode/decode for the chat API
+    import orjson
+except ImportError:
+    orjson = None
+
+def _format_clock(moment):
+    """Format a datetime like strftime('%I:%M %p') without the locale/strftime call"""
+    hour = moment.hour % 12 or 12
+    return f"{hour:02d}:{moment.minute:02d} {'AM' if moment.hour < 12 else 'PM'}"
+
+def _json_loads(raw):
+    """Decode a JSON request body (orjson when installed)"""
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+def _json_dumps(payload):
+    """Encode payload to JSON bytes (orjson when installed)"""
+    if orjson:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(',', ':')).encode('utf-8')
+
+def _json_response(payload):
+    """Build a JSON response, encoding with orjson when installed"""
+    if orjson:
+        return Response(orjson.dumps(payload), mimetype='application/json')
+    return jsonify(payload)
+
+# Sample data - built once at import and shared (read-only) by every request
+_SAMPLE_ROOMS = (
+    MappingProxyType({
+        'id': 1,
+        'name': 'General',
+        'description': 'General discussion for everyone',
+        'users_online': 12,
+        'last_message': 'Welcome to the chat!',
+        'last_activity': '2 minutes ago'
+    }),
+    MappingProxyType({
+        'id': 2,
+        'name': 'Tech Talk',
+        'description': 'Programming and technology discussions',
+        'users_online': 8,
+        'last_message': 'Anyone working with Python?',
+        'last_activity': '5 minutes ago'
+    }),
+    MappingProxyType({
+        'id': 3,
+        'name': 'Random',
+        'description': 'Off-topic conversations',
+        'users_online': 15,
+        'last_message': 'Coffee or tea?',
+        'last_activity': '1 minute ago'
+    })
+)
+
+# Room id -> display name, derived once from the sample rooms
+_ROOM_NAMES = MappingProxyType({room['id']: room['name'] for room in _SAMPLE_ROOMS})
+
+_SAMPLE_MESSAGES = (
+    MappingProxyType({
+        'id': 1,
+        'username': 'Alice',
+        'message': 'Hey everyone!',
+        'timestamp': '10:30 AM',
+        'is_own_message': False
+    }),
+    MappingProxyType({
+        'id': 2,
+        'username': 'Bob',
+        'message': 'How is everyone doing today?',
+        'timestamp': '10:32 AM',
+        'is_own_message': False
+    }),
+    MappingProxyType({
+        'id': 3,
+        'username': 'You',
+        'message': 'Great! Just joined the chat',
+        'timestamp': '10:35 AM',
+        'is_own_message': True
+    })
+)
+
+_SAMPLE_CONVERSATIONS = (
+    MappingProxyType({
+        'id': 1,
+        'username': 'Alice',
+        'last_message': 'Thanks for the help!',
+        'timestamp': '5 min ago',
+        'unread_count': 2,
+        'online': True
+    }),
+    MappingProxyType({
+        'id': 2,
+        'username': 'Bob',
+        'last_message': 'See you tomorrow',
+        'timestamp': '1 hour ago',
+        'unread_count': 0,
+        'online': False
+    })
+)
+
+# The sample rooms never change, so their JSON body is encoded once
+_SAMPLE_ROOMS_JSON = _json_dumps({'rooms': [dict(room) for room in _SAMPLE_ROOMS]})
 
 def register_chat_routes(app):
     """Register chat-related routes"""
-    
+
     @app.route('/chat')
     def chat_home():
         """Main chat interface"""
-        # Sample chat rooms
-        chat_rooms = [
-            {
-                'id': 1,
-                'name': 'General',
-                'description': 'General discussion for everyone',
-                'users_online': 12,
-                'last_message': 'Welcome to the chat!',
-                'last_activity': '2 minutes ago'
-            },
-            {
-                'id': 2,
-                'name': 'Tech Talk',
-                'description': 'Programming and technology discussions',
-                'users_online': 8,
-                'last_message': 'Anyone working with Python?',
-                'last_activity': '5 minutes ago'
-            },
-            {
-                'id': 3,
-                'name': 'Random',
-                'description': 'Off-topic conversations',
-                'users_online': 15,
-                'last_message': 'Coffee or tea?',
-                'last_activity': '1 minute ago'
-            }
-        ]
-        
-        return render_template('chat/chat.html', rooms=chat_rooms)
-    
+        return render_template('chat/chat.html', rooms=_SAMPLE_ROOMS)
+
     @app.route('/chat/room/<int:room_id>')
     def chat_room(room_id):
         """Individual chat room"""
         # Sample room data
         room_info = {
             'id': room_id,
-            'name': 'General' if room_id == 1 else 'Tech Talk' if room_id == 2 else 'Random',
+            'name': _ROOM_NAMES.get(room_id, 'Random'),
             'description': 'Room description here',
             'users_online': 12
         }
-        
-        # Sample messages
-        messages = [
-            {
-                'id': 1,
-                'username': 'Alice',
-                'message': 'Hey everyone!',
-                'timestamp': '10:30 AM',
-                'is_own_message': False
-            },
-            {
-                'id': 2,
-                'username': 'Bob',
-                'message': 'How is everyone doing today?',
-                'timestamp': '10:32 AM',
-                'is_own_message': False
-            },
-            {
-                'id': 3,
-                'username': 'You',
-                'message': 'Great! Just joined the chat',
-                'timestamp': '10:35 AM',
-                'is_own_message': True
-            }
-        ]
-        
-        return render_template('chat/room.html', room=room_info, messages=messages)
+
+        return render_template('chat/room.html', room=room_info, messages=_SAMPLE_MESSAGES)
+    
+    @app.route('/chat/api/rooms')
+    def list_rooms():
+        """API endpoint listing chat rooms (pre-encoded, no per-request JSON work)"""
+        return Response(_SAMPLE_ROOMS_JSON, mimetype='application/json')
     
     @app.route('/chat/api/send', methods=['POST'])
     def send_message():
         """API endpoint to send a message"""
-        data = request.get_json()
+        if request.mimetype == 'application/json':
+            # Fast path: decode the raw body directly, without Werkzeug's
+            # get_json machinery or keeping a cached copy of the body
+            raw = request.get_data(cache=False)
+            try:
+                data = _json_loads(raw)    # An empty body is invalid JSON too
+            except ValueError:
+                abort(400)
+        else:
+            data = request.get_json()    # Rejects non-JSON bodies as before
         message = data.get('message', '')
         room_id = data.get('room_id', 1)
         
         # Here you would save to database and broadcast to other users
         # For now, just return success
-        return jsonify({
+        return _json_response({
             'success': True,
             'message': message,
-            'timestamp': datetime.now().strftime('%I:%M %p'),
+            'timestamp': _format_clock(datetime.now()),
             'username': 'You'
         })
     
     @app.route('/chat/direct')
     def direct_messages():
         """Direct message interface"""
-        conversations = [
-            {
-                'id': 1,
-                'username': 'Alice',
-                'last_message': 'Thanks for the help!',
-                'timestamp': '5 min ago',
-                'unread_count': 2,
-                'online': True
-            },
-            {
-                'id': 2,
-                'username': 'Bob',
-                'last_message': 'See you tomorrow',
-                'timestamp': '1 hour ago',
-                'unread_count': 0,
-                'online': False
-            }
-        ]
-        
-        return render_template('chat/direct.html', conversations=conversations)
\ No newline at end of file
+        return render_template('chat/direct.html', conversations=_SAMPLE_CONVERSATIONS)
@@ -8,7 +8,8 @@ application data with proper connection management and error handling.
 
 Key Features:
 - Context-managed connections (automatic cleanup, rollback on errors)
-- Row-based access (dict-like result objects)
+- Lightweight rows: posts as PostRow / PostSummary namedtuples, other
+  queries as dicts
 - Safe parameterized queries (SQL injection prevention)
 - Automatic schema initialization
 - User management with profiles and sessions
@@ -41,49 +42,224 @@ Author: Created through AI-assisted development focusing on best practices
 """
 
 import sqlite3
+import json
+import logging
 import os
+import re
+import threading
+from collections import namedtuple
+from itertools import islice
 from datetime import datetime
 from contextlib import contextmanager
 
+logger = logging.getLogger(__name__)
+
+# Default fallback - project root instance folder, resolved once at import
+_DEFAULT_DB_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    'instance', 'app.db'
+)
+
+# Row type for blog listings (get_posts_summary, get_posts_by_category, search_posts)
+PostSummary = namedtuple('PostSummary', (
+    'id', 'title', 'excerpt', 'author', 'date',
+    'category', 'tags', 'featured_image', 'views', 'comments',
+))
+# Only what the listing cards show - full content stays in the database
+_SUMMARY_COLUMNS = (
+    'id, title, substr(content, 1, 200), author, date(created_at), '
+    'category, tags, featured_image, views, comments'
+)
+
+# Row type for full-post queries (every column of the posts table)
+PostRow = namedtuple('PostRow', (
+    'id', 'title', 'content', 'author', 'category', 'tags', 'featured_image',
+    'views', 'comments', 'published', 'created_at', 'updated_at',
+))
+_POST_COLUMNS = ', '.join(PostRow._fields)
+
+_FTS_TOKEN_RE = re.compile(r'\w+')
+
+# Smallest SQLite rowid (keyset pagination sentinel)
+_MIN_ROWID = -2 ** 63
+
+# Bound parameters per statement on older SQLite builds (bulk inserts chunk to fit)
+_SQLITE_MAX_PARAMS = 999
+
+def _chunked(rows, size):
+    """Yield lists of up to size items from any iterable"""
+    it = iter(rows)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+def _fetch_dicts(cursor):
+    """
+    Fetch the remaining rows of an executed cursor as dicts.
+    
+    Column names are read from cursor.description once per query and
+    zipped with plain tuples, instead of building a sqlite3.Row and
+    re-mapping its keys for every row.
+    """
+    cursor.row_factory = None
+    columns = tuple(column[0] for column in cursor.description)
+    return [dict(zip(columns, row)) for row in cursor]
+
+def _fetch_posts(cursor):
+    """Fetch the remaining rows of a _POST_COLUMNS query as PostRows"""
+    cursor.row_factory = None
+    return list(map(PostRow._make, cursor))
+
+def _fetch_summaries(cursor):
+    """Fetch the remaining rows of a _SUMMARY_COLUMNS query as PostSummaries"""
+    cursor.row_factory = None
+    return [
+        PostSummary(*row[:6], tuple(t for t in (row[6] or '').split(',') if t), *row[7:])
+        for row in cursor
+    ]
+
+def _unicode_lower(value):
+    """SQL function: str.lower() of a text value (other values unchanged)"""
+    return value.lower() if isinstance(value, str) else value
+
+def _join_tags(tags):
+    """Store a tag list as the comma-separated text column"""
+    return ','.join(tags) if isinstance(tags, (list, tuple)) else (tags or '')
+
+# Idle connections kept open for reuse (see DatabaseManager.get_connection)
+DEFAULT_POOL_SIZE = 8
+
+# Prepared statements each pooled connection keeps (sqlite3's default is 128)
+STATEMENT_CACHE_SIZE = 256
+
+# Distinct UPDATE statements remembered by DatabaseManager._update_sql
+UPDATE_SQL_CACHE_MAXSIZE = 256
+
+# Applied once to every new connection (these settings are per-connection).
+# NORMAL sync is durable under WAL without an fsync per commit, and the
+# 64 MB page cache / 256 MB mmap stay warm while pooled. WAL itself is
+# recorded in the database file, so init_database sets it once.
+_CONNECTION_PRAGMAS = (
+    'PRAGMA foreign_keys=ON',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA cache_size=-64000',
+    'PRAGMA mmap_size=268435456',
+)
+
+def _fts_match_query(text):
+    """
+    Turn free-form search text into a safe FTS5 MATCH expression.
+    
+    Every word becomes a quoted prefix term ("pyth"* matches "python"), and
+    terms are ANDed, so user input can never inject FTS5 query syntax.
+    Returns None when the text has no word characters.
+    """
+    tokens = _FTS_TOKEN_RE.findall(text or '')
+    if not tokens:
+        return None
+    return ' '.join(f'"{token}"*' for token in tokens)
+
 class DatabaseManager:
-    def __init__(self, db_path=None):
+    # Hot single-row lookups. Shared constants keep one compact SQL string per
+    # query, which is also the key of each connection's statement cache.
+    _SQL_USER_BY_ID = 'SELECT * FROM users WHERE id = ? AND is_active = 1'
+    _SQL_USER_BY_EMAIL = 'SELECT * FROM users WHERE email = ? AND is_active = 1'
+    _SQL_USER_BY_USERNAME = 'SELECT * FROM users WHERE username = ? AND is_active = 1'
+    _SQL_POST_BY_ID = f'SELECT {_POST_COLUMNS} FROM posts WHERE id = ? AND published = 1'
+    
+    def __init__(self, db_path=None, pool_size=DEFAULT_POOL_SIZE):
         """
         Initialize DatabaseManager with automatic schema setup.
         
         Args:
             db_path (str, optional): Path to SQLite database file.
                                    If None, uses default location in instance/ folder.
+            pool_size (int, optional): Maximum idle connections kept for reuse.
         
         The constructor automatically:
         1. Determines database location (user-specified or default)
         2. Creates directory structure if needed
         3. Initializes database schema (tables, indexes, constraints)
         """
-        if db_path is None:
-            # Default fallback - use project root instance folder for portability
-            project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-            instance_dir = os.path.join(project_root, 'instance')
-            os.makedirs(instance_dir, exist_ok=True)  # Safe directory creation
-            self.db_path = os.path.join(instance_dir, 'app.db')
-        else:
-            # Use Flask app's configured database path
-            self.db_path = db_path
+        # Flask app's configured database path, or the project default
+        self.db_path = db_path or _DEFAULT_DB_PATH
             
-        # Ensure parent directory exists for custom paths
-        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        # Ensure parent directory exists (a bare filename lives in the cwd)
+        db_dir = os.path.dirname(self.db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+        
+        # (table, key column, sorted column names) -> UPDATE statement
+        self._update_sql_cache = {}
+        
+        # Idle connections, most recently used last
+        self._pool = []
+        self._pool_lock = threading.Lock()
+        self._pool_max = pool_size
+        self._pool_pid = os.getpid()
         
         # Initialize schema - safe to call multiple times
         self.init_database()
     
+    def _update_sql(self, table, key_column, columns):
+        """
+        UPDATE statement setting columns (a sorted tuple) on table.
+        
+        The same set of columns always yields the identical SQL string, so
+        repeated updates hit each connection's prepared-statement cache
+        instead of being re-parsed. Bind values in the same sorted order.
+        """
+        cache_key = (table, key_column, columns)
+        sql = self._update_sql_cache.get(cache_key)
+        if sql is None:
+            set_clause = ", ".join([f"{column} = ?" for column in columns])
+            sql = f'UPDATE {table} SET {set_clause}, updated_at = CURRENT_TIMESTAMP WHERE {key_column} = ?'
+            if len(self._update_sql_cache) < UPDATE_SQL_CACHE_MAXSIZE:
+                self._update_sql_cache[cache_key] = sql
+        return sql
+    
+    def _new_connection(self):
+        """Open and tune a connection for the pool"""
+        # Pooled connections may be checked out by any request thread; the
+        # pool guarantees only one thread uses a connection at a time
+        conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                               cached_statements=STATEMENT_CACHE_SIZE)
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        # Full Unicode lower() for get_posts_by_category (SQLite's is ASCII-only)
+        conn.create_function('unicode_lower', 1, _unicode_lower, deterministic=True)
+        return conn
+    
+    def _release_connection(self, conn):
+        """Return a connection to the pool, or close it if the pool is full"""
+        try:
+            # Never hand the next caller someone else's open transaction or
+            # a row_factory a query switched off
+            if conn.in_transaction:
+                conn.rollback()
+            conn.row_factory = sqlite3.Row
+        except sqlite3.Error:
+            conn.close()
+            return
+        
+        with self._pool_lock:
+            if self._pool_pid == os.getpid() and len(self._pool) < self._pool_max:
+                self._pool.append(conn)
+                return
+        conn.close()
+    
     @contextmanager
     def get_connection(self):
         """
         Thread-safe database connection context manager.
         
-        Provides automatic connection management with proper error handling:
-        - Establishes connection with row-based access
+        Provides pooled connection management with proper error handling:
+        - Reuses an idle connection (keeping SQLite's page cache warm) or opens a new one
         - Rolls back transactions on any exception
-        - Ensures connection is always closed (prevents file locks)
+        - Returns the connection to the pool afterwards (closed if the pool is full)
         - Enables dict-like access to result rows
         
         Yields:
@@ -97,7 +273,19 @@ class DatabaseManager:
                 if user:
                     print(user['username'])  # Dict-like access
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = None
+        with self._pool_lock:
+            pid = os.getpid()
+            if self._pool_pid != pid:
+                # Forked worker: connections inherited from the parent must not
+                # be shared, so start with an empty pool (don't close them here)
+                self._pool = []
+                self._pool_pid = pid
+            if self._pool:
+                conn = self._pool.pop()
+        
+        if conn is None:
+            conn = self._new_connection()
         
         # Enable dict-like access to columns by name instead of index
         conn.row_factory = sqlite3.Row
@@ -109,12 +297,15 @@ class DatabaseManager:
             conn.rollback()
             raise e  # Re-raise for caller to handle
         finally:
-            # Always close connection to prevent locks and resource leaks
-            conn.close()
+            self._release_connection(conn)
     
     def init_database(self):
         """Initialize database with required tables"""
         with self.get_connection() as conn:
+            # WAL lets readers run alongside a writer and persists in the file.
+            # Must run before any statement opens a transaction.
+            conn.execute('PRAGMA journal_mode=WAL')
+            
             cursor = conn.cursor()
             
             # Users table
@@ -123,7 +314,7 @@ class DatabaseManager:
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     username TEXT UNIQUE NOT NULL,
                     email TEXT UNIQUE NOT NULL,
-                    password_hash TEXT NOT NULL,
+                    password_hash BLOB NOT NULL,
                     created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
                     updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
                     is_active BOOLEAN DEFAULT 1
@@ -158,6 +349,18 @@ class DatabaseManager:
                 )
             ''')
             
+            # Active-user listings. username/email/user_id lookups are already
+            # covered by their UNIQUE indexes; these serve the ORDER BY of
+            # search_users (username) and get_all_users (newest first).
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_users_active_username
+                ON users (username) WHERE is_active = 1
+            ''')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_users_active_created
+                ON users (created_at DESC) WHERE is_active = 1
+            ''')
+            
             conn.commit()
 
             # Blog posts table (optional for blog module)
@@ -178,13 +381,161 @@ class DatabaseManager:
                 )
             ''')
 
+            # Case-insensitive category lookups (get_posts_by_category)
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_posts_category
+                ON posts (category COLLATE NOCASE, created_at)
+            ''')
+
+            # Newest published posts first (get_posts, get_posts_summary) and
+            # the (created_at, id) keyset of get_posts_after - both scan this
+            # index backwards.
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_posts_pub_keyset
+                ON posts (created_at, id) WHERE published = 1
+            ''')
+
+            # Full-text indexes for search_posts / search_users
+            self.posts_fts_enabled = self._init_posts_fts(cursor)
+            self.users_fts_enabled = self._init_users_fts(cursor)
+
             conn.commit()
+
+            # Refresh planner statistics. optimize only re-analyzes tables whose
+            # stats are missing or stale, so it is cheap on every start; 0x10000
+            # makes SQLite 3.46+ check all tables, not just ones this
+            # connection has queried (older versions ignore the flag).
+            cursor.execute('PRAGMA optimize=0x10002')
+            conn.commit()
+
+    def _init_posts_fts(self, cursor):
+        """
+        Create the FTS5 index over posts (title, content, tags).
+        
+        The index is an external-content table kept in sync by triggers, so
+        search_posts becomes an inverted-index lookup instead of a LIKE scan
+        over every row. Existing posts are indexed the first time the table
+        is created.
+        
+        Returns:
+            bool: False if this SQLite build has no FTS5 (LIKE search is used)
+        """
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'posts_fts'")
+        exists = cursor.fetchone() is not None
+        try:
+            cursor.execute('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS posts_fts
+                USING fts5(title, content, tags, content='posts', content_rowid='id')
+            ''')
+        except sqlite3.OperationalError:
+            return False
+
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS posts_fts_insert AFTER INSERT ON posts BEGIN
+                INSERT INTO posts_fts (rowid, title, content, tags)
+                VALUES (new.id, new.title, new.content, new.tags);
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS posts_fts_delete AFTER DELETE ON posts BEGIN
+                INSERT INTO posts_fts (posts_fts, rowid, title, content, tags)
+                VALUES ('delete', old.id, old.title, old.content, old.tags);
+            END
+        ''')
+        # Only re-index when searchable text changes (not on view/comment counters)
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS posts_fts_update AFTER UPDATE OF title, content, tags ON posts BEGIN
+                INSERT INTO posts_fts (posts_fts, rowid, title, content, tags)
+                VALUES ('delete', old.id, old.title, old.content, old.tags);
+                INSERT INTO posts_fts (rowid, title, content, tags)
+                VALUES (new.id, new.title, new.content, new.tags);
+            END
+        ''')
+
+        if not exists:
+            cursor.execute("INSERT INTO posts_fts (posts_fts) VALUES ('rebuild')")
+        return True
+    
+    def _init_users_fts(self, cursor):
+        """
+        Create the FTS5 index over users (username, email, first/last name).
+        
+        The searchable text spans users and user_profiles, so unlike posts_fts
+        this table keeps its own copy of the text, one row per user (rowid is
+        the user id). Triggers on both tables re-index the affected user.
+        
+        Returns:
+            bool: False if this SQLite build has no FTS5 (LIKE search is used)
+        """
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'users_fts'")
+        exists = cursor.fetchone() is not None
+        try:
+            cursor.execute('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS users_fts
+                USING fts5(username, email, first_name, last_name)
+            ''')
+        except sqlite3.OperationalError:
+            return False
+
+        def reindex(user_id):
+            return f'''
+                DELETE FROM users_fts WHERE rowid = {user_id};
+                INSERT INTO users_fts (rowid, username, email, first_name, last_name)
+                SELECT u.id, u.username, u.email, p.first_name, p.last_name
+                FROM users u
+                LEFT JOIN user_profiles p ON u.id = p.user_id
+                WHERE u.id = {user_id};
+            '''
+
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS users_fts_insert AFTER INSERT ON users BEGIN
+                {reindex('new.id')}
+            END
+        ''')
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS users_fts_update AFTER UPDATE OF username, email ON users BEGIN
+                {reindex('new.id')}
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS users_fts_delete AFTER DELETE ON users BEGIN
+                DELETE FROM users_fts WHERE rowid = old.id;
+            END
+        ''')
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS users_fts_profile_insert AFTER INSERT ON user_profiles BEGIN
+                {reindex('new.user_id')}
+            END
+        ''')
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS users_fts_profile_update AFTER UPDATE OF first_name, last_name ON user_profiles BEGIN
+                {reindex('new.user_id')}
+            END
+        ''')
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS users_fts_profile_delete AFTER DELETE ON user_profiles BEGIN
+                {reindex('old.user_id')}
+            END
+        ''')
+
+        if not exists:
+            cursor.execute('''
+                INSERT INTO users_fts (rowid, username, email, first_name, last_name)
+                SELECT u.id, u.username, u.email, p.first_name, p.last_name
+                FROM users u
+                LEFT JOIN user_profiles p ON u.id = p.user_id
+            ''')
+        return True
     
     def create_user(self, username, email, password_hash):
         """Create a new user"""
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
+                # Take the write lock up front: a deferred transaction would
+                # have to upgrade its lock mid-way and can fail with "database
+                # is locked" when another request is writing at the same time
+                cursor.execute('BEGIN IMMEDIATE')
                 cursor.execute('''
                     INSERT INTO users (username, email, password_hash)
                     VALUES (?, ?, ?)
@@ -202,17 +553,52 @@ class DatabaseManager:
                 return user_id
         except sqlite3.IntegrityError:
             return None
-        except Exception as e:
-            print(f"Database error: {e}")
+        except Exception:
+            logger.exception("Database error")
+            return None
+    
+    def create_users_bulk(self, rows):
+        """
+        Create many users (with default profiles) in one transaction.
+        
+        Args:
+            rows: Iterable of (username, email, password_hash) tuples
+        
+        Returns:
+            int: Number of users created, or None if any row failed (nothing
+                 is inserted in that case, e.g. on a duplicate username/email)
+        """
+        chunk_size = _SQLITE_MAX_PARAMS // 3
+        created = 0
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                for chunk in _chunked(rows, chunk_size):
+                    cursor.execute(
+                        'INSERT INTO users (username, email, password_hash) VALUES '
+                        + ','.join(['(?, ?, ?)'] * len(chunk)),
+                        [value for row in chunk for value in row]
+                    )
+                    # Default profiles for the users just inserted
+                    cursor.execute(
+                        'INSERT INTO user_profiles (user_id) SELECT id FROM users WHERE username IN ('
+                        + ','.join(['?'] * len(chunk)) + ')',
+                        [row[0] for row in chunk]
+                    )
+                    created += len(chunk)
+                conn.commit()
+                return created
+        except sqlite3.IntegrityError:
+            return None
+        except Exception:
+            logger.exception("Database error")
             return None
     
     def get_user_by_id(self, user_id):
         """Get user by ID"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute('''
-                SELECT * FROM users WHERE id = ? AND is_active = 1
-            ''', (user_id,))
+            cursor.execute(self._SQL_USER_BY_ID, (user_id,))
             row = cursor.fetchone()
             return dict(row) if row else None
     
@@ -220,9 +606,7 @@ class DatabaseManager:
         """Get user by email"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute('''
-                SELECT * FROM users WHERE email = ? AND is_active = 1
-            ''', (email,))
+            cursor.execute(self._SQL_USER_BY_EMAIL, (email,))
             row = cursor.fetchone()
             return dict(row) if row else None
     
@@ -230,9 +614,7 @@ class DatabaseManager:
         """Get user by username"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute('''
-                SELECT * FROM users WHERE username = ? AND is_active = 1
-            ''', (username,))
+            cursor.execute(self._SQL_USER_BY_USERNAME, (username,))
             row = cursor.fetchone()
             return dict(row) if row else None
     
@@ -241,22 +623,18 @@ class DatabaseManager:
         if not kwargs:
             return False
         
-        # Build dynamic update query
-        set_clause = ", ".join([f"{key} = ?" for key in kwargs.keys()])
-        values = list(kwargs.values()) + [user_id]
+        # Columns in a fixed (sorted) order so the SQL text is reused
+        columns = tuple(sorted(kwargs))
+        values = [kwargs[column] for column in columns] + [user_id]
         
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute(f'''
-                    UPDATE users 
-                    SET {set_clause}, updated_at = CURRENT_TIMESTAMP
-                    WHERE id = ?
-                ''', values)
+                cursor.execute(self._update_sql('users', 'id', columns), values)
                 conn.commit()
                 return cursor.rowcount > 0
-        except Exception as e:
-            print(f"Update error: {e}")
+        except Exception:
+            logger.exception("Update error")
             return False
     
     def delete_user(self, user_id):
@@ -271,12 +649,12 @@ class DatabaseManager:
                 ''', (user_id,))
                 conn.commit()
                 return cursor.rowcount > 0
-        except Exception as e:
-            print(f"Delete error: {e}")
+        except Exception:
+            logger.exception("Delete error")
             return False
     
-    def get_user_profile(self, user_id):
-        """Get user profile"""
+    def get_user_full(self, user_id):
+        """Get a user together with their profile fields in one query"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute('''
@@ -288,51 +666,123 @@ class DatabaseManager:
             row = cursor.fetchone()
             return dict(row) if row else None
     
+    def get_user_profile(self, user_id):
+        """Get user profile"""
+        return self.get_user_full(user_id)
+    
     def update_user_profile(self, user_id, **profile_data):
         """Update user profile"""
         if not profile_data:
             return False
         
-        set_clause = ", ".join([f"{key} = ?" for key in profile_data.keys()])
-        values = list(profile_data.values()) + [user_id]
+        columns = tuple(sorted(profile_data))
+        values = [profile_data[column] for column in columns] + [user_id]
         
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute(f'''
-                    UPDATE user_profiles 
-                    SET {set_clause}, updated_at = CURRENT_TIMESTAMP
-                    WHERE user_id = ?
-                ''', values)
+                cursor.execute(self._update_sql('user_profiles', 'user_id', columns), values)
                 conn.commit()
                 return cursor.rowcount > 0
-        except Exception as e:
-            print(f"Profile update error: {e}")
+        except Exception:
+            logger.exception("Profile update error")
             return False
     
-    def get_all_users(self, limit=100, offset=0):
-        """Get all active users with pagination"""
+    def get_all_users(self, limit=100, offset=0, include_profile=True):
+        """
+        Get all active users with pagination.
+        
+        Pass include_profile=False to skip the user_profiles join when the
+        first_name/last_name fields aren't needed.
+        """
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute('''
-                SELECT u.id, u.username, u.email, u.created_at,
-                       p.first_name, p.last_name
-                FROM users u
-                LEFT JOIN user_profiles p ON u.id = p.user_id
-                WHERE u.is_active = 1
-                ORDER BY u.created_at DESC
-                LIMIT ? OFFSET ?
-            ''', (limit, offset))
-            return [dict(row) for row in cursor.fetchall()]
+            if include_profile:
+                cursor.execute('''
+                    SELECT u.id, u.username, u.email, u.created_at,
+                           p.first_name, p.last_name
+                    FROM users u
+                    LEFT JOIN user_profiles p ON u.id = p.user_id
+                    WHERE u.is_active = 1
+                    ORDER BY u.created_at DESC
+                    LIMIT ? OFFSET ?
+                ''', (limit, offset))
+            else:
+                cursor.execute('''
+                    SELECT id, username, email, created_at
+                    FROM users
+                    WHERE is_active = 1
+                    ORDER BY created_at DESC
+                    LIMIT ? OFFSET ?
+                ''', (limit, offset))
+            return _fetch_dicts(cursor)
     
-    def search_users(self, query, limit=50):
-        """Search users by username or email"""
+    def get_users_json(self, limit=100, offset=0):
+        """
+        get_all_users() as a JSON array string, built inside SQLite.
+        
+        Routes can send the result as-is with
+        Response(body, mimetype='application/json') - no per-row dicts and
+        no json.dumps on the Python side.
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute('''
+                    SELECT json_group_array(json_object(
+                        'id', id, 'username', username, 'email', email,
+                        'created_at', created_at,
+                        'first_name', first_name, 'last_name', last_name
+                    ))
+                    FROM (
+                        SELECT u.id, u.username, u.email, u.created_at,
+                               p.first_name, p.last_name
+                        FROM users u
+                        LEFT JOIN user_profiles p ON u.id = p.user_id
+                        WHERE u.is_active = 1
+                        ORDER BY u.created_at DESC
+                        LIMIT ? OFFSET ?
+                    )
+                ''', (limit, offset))
+                return cursor.fetchone()[0]
+            except sqlite3.OperationalError:
+                pass  # SQLite built without JSON functions
+        return json.dumps(self.get_all_users(limit, offset))
+    
+    def search_users(self, query, limit=50, include_profile=True):
+        """
+        Search users by username, email or name.
+        
+        Names are always searched; include_profile=False only leaves the
+        first_name/last_name fields out of the results.
+        """
+        columns = 'u.id, u.username, u.email'
+        if include_profile:
+            columns += ', p.first_name, p.last_name'
+        
+        match = _fts_match_query(query) if self.users_fts_enabled else None
+        if match:
+            # users_fts holds the names, so the join is only for output
+            profile_join = 'LEFT JOIN user_profiles p ON u.id = p.user_id' if include_profile else ''
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(f'''
+                    SELECT {columns}
+                    FROM users_fts
+                    JOIN users u ON u.id = users_fts.rowid
+                    {profile_join}
+                    WHERE users_fts MATCH ? AND u.is_active = 1
+                    ORDER BY u.username
+                    LIMIT ?
+                ''', (match, limit))
+                return _fetch_dicts(cursor)
+        
+        # No FTS5, or nothing word-like to match on: substring scan
         with self.get_connection() as conn:
             cursor = conn.cursor()
             search_term = f"%{query}%"
-            cursor.execute('''
-                SELECT u.id, u.username, u.email,
-                       p.first_name, p.last_name
+            cursor.execute(f'''
+                SELECT {columns}
                 FROM users u
                 LEFT JOIN user_profiles p ON u.id = p.user_id
                 WHERE u.is_active = 1 
@@ -341,16 +791,23 @@ class DatabaseManager:
                 ORDER BY u.username
                 LIMIT ?
             ''', (search_term, search_term, search_term, search_term, limit))
-            return [dict(row) for row in cursor.fetchall()]
+            return _fetch_dicts(cursor)
     
     def close(self):
-        """Close database connection (for cleanup)"""
-        # Using context manager, so no persistent connection to close
-        pass
+        """Close pooled database connections (for cleanup)"""
+        with self._pool_lock:
+            pool, self._pool = self._pool, []
+        for conn in pool:
+            # Analyze whatever this connection's queries found under-indexed
+            try:
+                conn.execute('PRAGMA optimize')
+            except sqlite3.Error:
+                pass
+            conn.close()
 
     # Simple blog helpers
     def create_post(self, title, content, author=None, category=None, tags=None, featured_image=None, published=True):
-        tags_str = ','.join(tags) if isinstance(tags, (list, tuple)) else (tags or '')
+        tags_str = _join_tags(tags)
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
@@ -360,39 +817,198 @@ class DatabaseManager:
                 ''', (title, content, author, category, tags_str, featured_image, 1 if published else 0))
                 conn.commit()
                 return cursor.lastrowid
-        except Exception as e:
-            print(f"Create post error: {e}")
+        except Exception:
+            logger.exception("Create post error")
+            return None
+
+    def create_posts_bulk(self, rows):
+        """
+        Create many posts in one transaction.
+        
+        Args:
+            rows: Iterable of dicts with create_post's keyword arguments
+                  ('title' and 'content' required)
+        
+        Returns:
+            int: Number of posts created, or None on error (nothing is inserted)
+        """
+        chunk_size = _SQLITE_MAX_PARAMS // 7
+        created = 0
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                for chunk in _chunked(rows, chunk_size):
+                    params = []
+                    for row in chunk:
+                        params.extend((
+                            row['title'], row['content'], row.get('author'), row.get('category'),
+                            _join_tags(row.get('tags')), row.get('featured_image'),
+                            1 if row.get('published', True) else 0,
+                        ))
+                    cursor.execute(
+                        'INSERT INTO posts (title, content, author, category, tags, featured_image, published) VALUES '
+                        + ','.join(['(?, ?, ?, ?, ?, ?, ?)'] * len(chunk)),
+                        params
+                    )
+                    created += len(chunk)
+                conn.commit()
+                return created
+        except Exception:
+            logger.exception("Create posts error")
             return None
 
     def get_posts(self, limit=20, offset=0):
+        # Plain tuples wrapped in PostRow: attribute access (post.title) with
+        # no per-row sqlite3.Row or dict. Columns are listed explicitly so a
+        # schema change can't shift the fields.
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute('''
-                SELECT * FROM posts WHERE published = 1
+            cursor.execute(f'''
+                SELECT {_POST_COLUMNS} FROM posts WHERE published = 1
+                ORDER BY created_at DESC
+                LIMIT ? OFFSET ?
+            ''', (limit, offset))
+            return _fetch_posts(cursor)
+
+    def get_posts_after(self, created_at=None, post_id=None, limit=20):
+        """
+        Keyset pagination over published posts, newest first.
+        
+        Pass the created_at and id of the last post on the previous page to
+        get the next one (omit both for the first page). Unlike OFFSET, the
+        cost does not grow with how deep the page is: the index seeks
+        straight to the cursor position. Ties on created_at are broken by id,
+        so no post is skipped or repeated between pages.
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            if created_at is None:
+                cursor.execute(f'''
+                    SELECT {_POST_COLUMNS} FROM posts WHERE published = 1
+                    ORDER BY created_at DESC, id DESC
+                    LIMIT ?
+                ''', (limit,))
+            else:
+                # Without an id, every post at that timestamp counts as seen
+                cursor.execute(f'''
+                    SELECT {_POST_COLUMNS} FROM posts WHERE published = 1
+                    AND (created_at, id) < (?, ?)
+                    ORDER BY created_at DESC, id DESC
+                    LIMIT ?
+                ''', (created_at, _MIN_ROWID if post_id is None else post_id, limit))
+            return _fetch_posts(cursor)
+
+    def iter_posts(self, limit=None, offset=0):
+        """
+        Yield published posts (newest first) one PostRow at a time.
+        
+        Rows are streamed from the cursor, so a large export never holds the
+        whole result in memory. The pooled connection stays checked out until
+        the generator is exhausted or closed - wrap early exits in
+        contextlib.closing(). limit=None streams every post.
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f'''
+                SELECT {_POST_COLUMNS} FROM posts WHERE published = 1
+                ORDER BY created_at DESC
+                LIMIT ? OFFSET ?
+            ''', (-1 if limit is None else limit, offset))
+            cursor.row_factory = None
+            for row in cursor:
+                yield PostRow._make(row)
+
+    def get_posts_json(self, limit=20, offset=0):
+        """get_posts() as a JSON array string, built inside SQLite (see get_users_json)"""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute('''
+                    SELECT json_group_array(json_object(
+                        'id', id, 'title', title, 'content', content,
+                        'author', author, 'category', category, 'tags', tags,
+                        'featured_image', featured_image, 'views', views,
+                        'comments', comments, 'published', published,
+                        'created_at', created_at, 'updated_at', updated_at
+                    ))
+                    FROM (
+                        SELECT * FROM posts WHERE published = 1
+                        ORDER BY created_at DESC
+                        LIMIT ? OFFSET ?
+                    )
+                ''', (limit, offset))
+                return cursor.fetchone()[0]
+            except sqlite3.OperationalError:
+                pass  # SQLite built without JSON functions
+        return json.dumps([post._asdict() for post in self.get_posts(limit, offset)])
+
+    def get_posts_summary(self, limit=20, offset=0):
+        # Listing view: only the columns the cards show - full content stays
+        # in the database and each row is a light namedtuple instead of a dict
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f'''
+                SELECT {_SUMMARY_COLUMNS}
+                FROM posts WHERE published = 1
                 ORDER BY created_at DESC
                 LIMIT ? OFFSET ?
             ''', (limit, offset))
-            return [dict(row) for row in cursor.fetchall()]
+            return _fetch_summaries(cursor)
+
+    def get_posts_by_category(self, category, limit=20):
+        # Listing rows (PostSummary), matched case-insensitively with Python's
+        # str.lower() rules.
+        # SQLite's NOCASE only folds ASCII, so it is used (an index lookup on
+        # idx_posts_category) only when the requested name is plain ASCII.
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            if category.isascii():
+                cursor.execute(f'''
+                    SELECT {_SUMMARY_COLUMNS} FROM posts WHERE published = 1 AND category = ? COLLATE NOCASE
+                    ORDER BY created_at DESC
+                    LIMIT ?
+                ''', (category, limit))
+            else:
+                cursor.execute(f'''
+                    SELECT {_SUMMARY_COLUMNS} FROM posts WHERE published = 1 AND unicode_lower(category) = ?
+                    ORDER BY created_at DESC
+                    LIMIT ?
+                ''', (category.lower(), limit))
+            return _fetch_summaries(cursor)
 
     def get_post_by_id(self, post_id):
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute('''
-                SELECT * FROM posts WHERE id = ? AND published = 1
-            ''', (post_id,))
+            cursor.execute(self._SQL_POST_BY_ID, (post_id,))
+            cursor.row_factory = None
             row = cursor.fetchone()
-            return dict(row) if row else None
+            return PostRow._make(row) if row else None
 
     def search_posts(self, query, limit=20):
+        # Listing rows (PostSummary), newest first
+        match = _fts_match_query(query) if self.posts_fts_enabled else None
+        if match:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(f'''
+                    SELECT {_SUMMARY_COLUMNS} FROM posts
+                    WHERE id IN (SELECT rowid FROM posts_fts WHERE posts_fts MATCH ?)
+                    AND published = 1
+                    ORDER BY created_at DESC
+                    LIMIT ?
+                ''', (match, limit))
+                return _fetch_summaries(cursor)
+
+        # No FTS5, or nothing word-like to match on: substring scan
         search_term = f"%{query}%"
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute('''
-                SELECT * FROM posts WHERE published = 1 AND (title LIKE ? OR content LIKE ? OR tags LIKE ?)
+            cursor.execute(f'''
+                SELECT {_SUMMARY_COLUMNS} FROM posts WHERE published = 1 AND (title LIKE ? OR content LIKE ? OR tags LIKE ?)
                 ORDER BY created_at DESC
                 LIMIT ?
             ''', (search_term, search_term, search_term, limit))
-            return [dict(row) for row in cursor.fetchall()]
+            return _fetch_summaries(cursor)
 
 # Global database instance - will be properly initialized by Flask app
 db = None
\ No newline at end of file
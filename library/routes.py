@@ -3,12 +3,129 @@ Route modules for common Flask functionality
 """
 
 from flask import render_template, request, redirect, url_for, flash
-from . import auth
+from types import MappingProxyType
 from .modules.chat import register_chat_routes
 from .modules.blog import register_blog_routes
 
+# Dashboard sample data, shared read-only by every request
+# (mapping proxies so a template or view can't mutate them by accident)
+_CHAT_STATS = MappingProxyType({
+    'total_messages': 247,
+    'active_chats': 5,
+    'unread_messages': 3,
+    'online_friends': 12
+})
+
+_CHAT_RECENT = (
+    MappingProxyType({
+        'title': 'General Chat',
+        'description': 'Join the community discussion',
+        'timestamp': '2 minutes ago',
+        'type': 'chat'
+    }),
+    MappingProxyType({
+        'title': 'Tech Talk',
+        'description': 'Latest programming discussions',
+        'timestamp': '15 minutes ago',
+        'type': 'chat'
+    })
+)
+
+_GALLERY_STATS = MappingProxyType({
+    'total_photos': 342,
+    'albums': 8,
+    'favorites': 23,
+    'storage_used': '67%'
+})
+
+_GALLERY_RECENT = (
+    MappingProxyType({
+        'title': 'Vacation 2025',
+        'description': 'Beach photos from summer trip',
+        'timestamp': '1 hour ago',
+        'type': 'photo'
+    }),
+    MappingProxyType({
+        'title': 'City Lights',
+        'description': 'Night photography collection',
+        'timestamp': '3 hours ago',
+        'type': 'photo'
+    })
+)
+
+_BLOG_STATS = MappingProxyType({
+    'total_posts': 24,
+    'draft_posts': 3,
+    'total_views': 1847,
+    'comments': 89
+})
+
+_BLOG_RECENT = (
+    MappingProxyType({
+        'title': 'Getting Started with Python',
+        'description': 'A comprehensive guide for beginners to learn Python programming',
+        'timestamp': '2 hours ago',
+        'views': 156,
+        'comments': 12,
+        'type': 'blog'
+    }),
+    MappingProxyType({
+        'title': 'Web Development Best Practices',
+        'description': 'Essential tips and tricks for modern web development',
+        'timestamp': '1 day ago',
+        'views': 234,
+        'comments': 18,
+        'type': 'blog'
+    }),
+    MappingProxyType({
+        'title': 'Database Design Fundamentals',
+        'description': 'Understanding the principles of good database architecture',
+        'timestamp': '3 days ago',
+        'views': 189,
+        'comments': 7,
+        'type': 'blog'
+    })
+)
+
+# Default item tracker dashboard
+_DEFAULT_STATS = MappingProxyType({
+    'total_items': 15,
+    'active_items': 8,
+    'pending_items': 4,
+    'completed_items': 3
+})
+
+_DEFAULT_RECENT = (
+    MappingProxyType({
+        'title': 'Welcome!',
+        'description': 'Dashboard loaded successfully',
+        'timestamp': 'Just now',
+        'type': 'system'
+    }),
+)
+
+# DASHBOARD_TYPE -> (template, stats, recent_activity); unknown types use 'default'
+_DASHBOARDS = MappingProxyType({
+    'chat': ('dashboard/chat-dashboard.html', _CHAT_STATS, _CHAT_RECENT),
+    'gallery': ('dashboard/gallery-dashboard.html', _GALLERY_STATS, _GALLERY_RECENT),
+    'blog': ('dashboard/blog-dashboard.html', _BLOG_STATS, _BLOG_RECENT),
+    'default': ('dashboard/dashboard.html', _DEFAULT_STATS, _DEFAULT_RECENT),
+})
+
 def register_auth_routes(app):
     """Register authentication routes"""
+    from .modules.auth import auth
+    
+    # Redirect targets only change with the mount point, so each endpoint is
+    # built once per script root instead of walking the URL map per request
+    redirect_urls = {}
+    
+    def redirect_to(endpoint):
+        key = (endpoint, request.script_root)
+        url = redirect_urls.get(key)
+        if url is None:
+            url = redirect_urls[key] = url_for(endpoint)
+        return redirect(url)
     
     @app.route('/register', methods=['GET', 'POST'])
     def register():
@@ -25,7 +142,7 @@ def register_auth_routes(app):
             success, message = auth.register_user(username, email, password)
             if success:
                 flash(message, 'success')
-                return redirect(url_for('login'))
+                return redirect_to('login')
             else:
                 flash(message, 'error')
         
@@ -40,7 +157,7 @@ def register_auth_routes(app):
             success, message = auth.login_user(email, password)
             if success:
                 flash(message, 'success')
-                return redirect(url_for('dashboard'))
+                return redirect_to('dashboard')
             else:
                 flash(message, 'error')
         
@@ -50,138 +167,30 @@ def register_auth_routes(app):
     def logout():
         auth.logout_user()
         flash('You have been logged out', 'info')
-        return redirect(url_for('index'))
+        return redirect_to('index')
 
 def register_dashboard_routes(app):
     """Register dashboard routes (works with or without auth module)"""
+    default_dashboard = _DASHBOARDS['default']
+    
     # Register dashboard route and let the configuration choose which
     # dashboard variant to render. This avoids depending on whether auth
     # routes were registered earlier and makes the dashboard_type config
     # the single source of truth.
-    @app.route('/dashboard')
-    @app.route('/')  # Make dashboard the home page too
     def dashboard():
         # Choose dashboard type based on app config
         dashboard_type = app.config.get('DASHBOARD_TYPE', 'default')
-        print(f"📊 LOADING DASHBOARD: {dashboard_type}")
-
-        if dashboard_type == 'chat':
-            # Chat site stats
-            stats = {
-                'total_messages': 247,
-                'active_chats': 5,
-                'unread_messages': 3,
-                'online_friends': 12
-            }
-
-            recent_activity = [
-                {
-                    'title': 'General Chat',
-                    'description': 'Join the community discussion',
-                    'timestamp': '2 minutes ago',
-                    'type': 'chat'
-                },
-                {
-                    'title': 'Tech Talk',
-                    'description': 'Latest programming discussions',
-                    'timestamp': '15 minutes ago',
-                    'type': 'chat'
-                }
-            ]
-
-            return render_template('dashboard/chat-dashboard.html',
-                                 stats=stats,
-                                 recent_activity=recent_activity)
-
-        elif dashboard_type == 'gallery':
-            # Gallery site stats
-            stats = {
-                'total_photos': 342,
-                'albums': 8,
-                'favorites': 23,
-                'storage_used': '67%'
-            }
-
-            recent_activity = [
-                {
-                    'title': 'Vacation 2025',
-                    'description': 'Beach photos from summer trip',
-                    'timestamp': '1 hour ago',
-                    'type': 'photo'
-                },
-                {
-                    'title': 'City Lights',
-                    'description': 'Night photography collection',
-                    'timestamp': '3 hours ago',
-                    'type': 'photo'
-                }
-            ]
-
-            return render_template('dashboard/gallery-dashboard.html',
-                                 stats=stats,
-                                 recent_activity=recent_activity)
-
-        elif dashboard_type == 'blog':
-            # Blog site stats
-            stats = {
-                'total_posts': 24,
-                'draft_posts': 3,
-                'total_views': 1847,
-                'comments': 89
-            }
-
-            recent_activity = [
-                {
-                    'title': 'Getting Started with Python',
-                    'description': 'A comprehensive guide for beginners to learn Python programming',
-                    'timestamp': '2 hours ago',
-                    'views': 156,
-                    'comments': 12,
-                    'type': 'blog'
-                },
-                {
-                    'title': 'Web Development Best Practices',
-                    'description': 'Essential tips and tricks for modern web development',
-                    'timestamp': '1 day ago',
-                    'views': 234,
-                    'comments': 18,
-                    'type': 'blog'
-                },
-                {
-                    'title': 'Database Design Fundamentals',
-                    'description': 'Understanding the principles of good database architecture',
-                    'timestamp': '3 days ago',
-                    'views': 189,
-                    'comments': 7,
-                    'type': 'blog'
-                }
-            ]
-
-            return render_template('dashboard/blog-dashboard.html',
-                                 stats=stats,
-                                 recent_activity=recent_activity)
-
-        else:
-            # Default item tracker dashboard
-            stats = {
-                'total_items': 15,
-                'active_items': 8,
-                'pending_items': 4,
-                'completed_items': 3
-            }
-
-            recent_activity = [
-                {
-                    'title': 'Welcome!',
-                    'description': 'Dashboard loaded successfully',
-                    'timestamp': 'Just now',
-                    'type': 'system'
-                }
-            ]
-
-            return render_template('dashboard/dashboard.html',
-                                 stats=stats,
-                                 recent_activity=recent_activity)
+        template, stats, recent_activity = _DASHBOARDS.get(dashboard_type, default_dashboard)
+        return render_template(template,
+                               stats=stats,
+                               recent_activity=recent_activity)
+    
+    # '/' belongs to the main module when it is loaded; otherwise make the
+    # dashboard the home page too. Registered first so url_for('dashboard')
+    # still builds '/' on dashboard-only sites.
+    if 'main' not in app.config.get('MODULES', ()):
+        app.add_url_rule('/', view_func=dashboard)
+    app.add_url_rule('/dashboard', view_func=dashboard)
 
 def register_main_routes(app):
     """Register main/basic routes"""